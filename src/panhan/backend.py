@@ -0,0 +1,172 @@
+"""Long-lived pandoc server backend.
+
+`pandoc server` (pandoc >= 3.0) keeps a single pandoc process alive and
+accepts conversions over localhost HTTP, eliminating the per-document
+startup cost of launching pandoc. Only a subset of panhan's settings
+maps onto the server API; `supports` reports whether a conversion can
+take this path, and callers fall back to pypandoc otherwise.
+"""
+
+import json
+import socket
+import subprocess
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+from typing import Any
+
+from panhan.logger import logger
+
+# pandoc CLI args addressable through the server JSON API.
+_ARG_OPTION_MAP = {
+    "--standalone": ("standalone", True),
+    "-s": ("standalone", True),
+    "--toc": ("table-of-contents", True),
+    "--table-of-contents": ("table-of-contents", True),
+    "--number-sections": ("number-sections", True),
+}
+
+# Output formats returned by the server as plain text; binary formats
+# come back base64-encoded and are left to pypandoc.
+_TEXT_FORMATS = frozenset(
+    {
+        "asciidoc",
+        "commonmark",
+        "gfm",
+        "html",
+        "html4",
+        "html5",
+        "json",
+        "latex",
+        "man",
+        "markdown",
+        "mediawiki",
+        "org",
+        "plain",
+        "rst",
+        "texinfo",
+    }
+)
+
+_STARTUP_TIMEOUT = 5.0
+
+
+def _find_free_port() -> int:
+    """Pick a currently free localhost port.
+
+    Returns:
+        port number.
+    """
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return int(sock.getsockname()[1])
+
+
+class PandocServerBackend:
+    """Convert documents through one long-lived `pandoc server` process."""
+
+    def __init__(self, pandoc_path: str = "pandoc") -> None:
+        self._pandoc_path = pandoc_path
+        self._port = _find_free_port()
+        self._process: subprocess.Popen[bytes] | None = None
+
+    @classmethod
+    def try_start(cls, pandoc_path: str = "pandoc") -> "PandocServerBackend | None":
+        """Start a server backend, or return None if unsupported.
+
+        Args:
+            pandoc_path: pandoc executable to launch.
+
+        Returns:
+            running backend, or None when `pandoc server` is unusable.
+        """
+        backend = cls(pandoc_path)
+        try:
+            backend.start()
+        except Exception as exc:
+            logger.info("pandoc server unavailable (%s); using pypandoc.", exc)
+            return None
+        return backend
+
+    def start(self) -> None:
+        """Launch the server process and wait for it to accept requests.
+
+        Raises:
+            RuntimeError: the process exited during startup.
+            TimeoutError: the server did not come up in time.
+        """
+        self._process = subprocess.Popen(
+            [self._pandoc_path, "server", "--port", str(self._port)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + _STARTUP_TIMEOUT
+        while time.monotonic() < deadline:
+            if self._process.poll() is not None:
+                raise RuntimeError("pandoc server exited at startup")
+            try:
+                with urllib.request.urlopen(self._url("/version"), timeout=1):
+                    return
+            except (urllib.error.URLError, ConnectionError):
+                time.sleep(0.05)
+        self.stop()
+        raise TimeoutError("pandoc server did not come up")
+
+    def stop(self) -> None:
+        """Terminate the server process if running."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.wait(timeout=5)
+            self._process = None
+
+    def _url(self, route: str = "") -> str:
+        return f"http://127.0.0.1:{self._port}{route}"
+
+    def supports(self, pypandoc_kwargs: dict[str, Any]) -> bool:
+        """Check whether this conversion can go through the server.
+
+        Args:
+            pypandoc_kwargs: kwargs as produced by `get_pypandoc_kwargs`.
+
+        Returns:
+            True if every setting maps onto the server API.
+        """
+        if pypandoc_kwargs.get("filters"):
+            return False
+        if pypandoc_kwargs.get("to") not in _TEXT_FORMATS:
+            return False
+        extra_args = pypandoc_kwargs.get("extra_args") or []
+        return all(arg in _ARG_OPTION_MAP for arg in extra_args)
+
+    def convert(self, source_text: str, pypandoc_kwargs: dict[str, Any]) -> str:
+        """Convert markdown `source_text` via the server.
+
+        Args:
+            source_text: markdown document text.
+            pypandoc_kwargs: kwargs as produced by `get_pypandoc_kwargs`.
+
+        Returns:
+            converted text, or "" when written to an output file
+            (matching the pypandoc contract).
+        """
+        payload: dict[str, Any] = {
+            "text": source_text,
+            "from": "markdown",
+            "to": pypandoc_kwargs.get("to"),
+        }
+        for arg in pypandoc_kwargs.get("extra_args") or []:
+            option, value = _ARG_OPTION_MAP[arg]
+            payload[option] = value
+        request = urllib.request.Request(
+            self._url(),
+            data=json.dumps(payload).encode(),
+            headers={"Content-Type": "application/json"},
+        )
+        with urllib.request.urlopen(request, timeout=60) as response:
+            converted = response.read().decode()
+        outputfile = pypandoc_kwargs.get("outputfile")
+        if outputfile:
+            Path(str(outputfile)).write_text(converted)
+            return ""
+        return converted
@@ -1,11 +1,14 @@
-import inspect
 import sys
 from argparse import ArgumentParser
 from logging import DEBUG, INFO
 
-from panhan import __version__, commands
+from panhan import __version__
 from panhan.logger import logger
 
+# Argparse args forwarded to commands.process_source_files; must match
+# its parameter names.
+_FORWARD_ARGS = ("SOURCE", "preset", "output", "config", "batch", "jobs", "cache")
+
 
 def get_parser() -> ArgumentParser:
     """Get CLI argument parser.
@@ -23,6 +26,22 @@ def get_parser() -> ArgumentParser:
     parser.add_argument("--config", help="path to panhan.yaml")
     parser.add_argument("--preset", help="name of preset to use; overrides document config")
     parser.add_argument("--output", help="output path; only used if --preset is specified")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="number of source files to convert in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="reuse cached output for unchanged source/settings pairs",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="convert sources with identical settings in one pandoc call (concatenates output)",
+    )
     parser.add_argument("--config-template", action="store_true", help="print panhan config template and exit")
     parser.add_argument("--verbose", action="store_true", help="print verbose output")
     parser.add_argument("--debug", action="store_true", help="print debug output")
@@ -46,19 +65,23 @@ def cli() -> None:
         parser.print_help()
         return
 
+    # Import deferred so fast-exit paths above avoid the heavy
+    # pypandoc/frontmatter/yaml dependency chain.
+    from panhan import commands
+
     # Print YAML template and quit.
     if args.config_template:
         commands.print_panhan_yaml_template()
         return
 
     # Select args that should be passed to main.
-    args_dict = {
-        k: v
-        for k, v in vars(args).items()
-        if k in inspect.signature(commands.process_source_files).parameters
-    }
+    args_dict = {k: getattr(args, k) for k in _FORWARD_ARGS if hasattr(args, k)}
 
-    commands.process_source_files(**args_dict)
+    try:
+        commands.process_source_files(**args_dict)
+    except Exception as exc:
+        logger.exception("Exception raised: %s", exc)
+        sys.exit(1)
 
 
 if __name__ == "__main__":
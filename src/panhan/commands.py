@@ -1,54 +1,50 @@
+import concurrent.futures
+import functools as ft
 import os
-import tempfile
+import re
+import shutil
 from getpass import getuser
 from pathlib import Path
-from textwrap import dedent
 from typing import Any, Iterable
 
-import frontmatter  # type: ignore
-import pypandoc  # type: ignore
-import yaml
-
 from panhan.logger import logdec, logger
 from panhan.config import BaseConfig, DocumentConfig, PanhanFrontmatter
 
 BASE_CONFIG_FILENAME = "panhan.yaml"
 USER_CONFIG_LOCATION = Path.home() / ".config/panhan/" / BASE_CONFIG_FILENAME
+CACHE_DIR = Path.home() / ".cache" / "panhan"
+
+# Set while a pandoc server is running (see PANHAN_PANDOC_SERVER).
+_server_backend: Any = None
+
+# Bound on first use so importing this module stays free of PyYAML.
+_YAML_LOADER: Any = None
+
+
+def _get_yaml_loader() -> Any:
+    """Get the fastest available YAML loader class.
+
+    Prefers the libyaml-backed CSafeLoader (shipped with PyYAML wheels
+    on major platforms) and falls back to the pure-Python SafeLoader.
+
+    Returns:
+        YAML loader class.
+    """
+    global _YAML_LOADER
+    if _YAML_LOADER is None:
+        import yaml
+
+        _YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return _YAML_LOADER
 
 
 @logdec
 def print_panhan_yaml_template() -> None:
-    yaml_template = f"""\
-    #{USER_CONFIG_LOCATION}
-    presets:
-        default:
-            output_format: html
-            metadata:
-                author: {getuser()}
-            pandoc_args:
-                standalone: true
-
-        preset_one:
-            output_format: html
-            output_file: output.html
-            metadata:
-                arg1: value
-                arg2: value
-            pandoc_args:
-                arg1: value
-                arg2: value
-            filters:
-                - filter1
-                - filter2
-
-        preset_two:
-            use_preset: preset_one
-            filters:
-                - filter3
-
-    pandoc_path: null
-    """
-    print(dedent(yaml_template))
+    """Print a starter panhan.yaml template."""
+    from importlib.resources import files
+
+    yaml_template = files("panhan").joinpath("templates/panhan.yaml.tmpl").read_text()
+    print(yaml_template.format(user_config_location=USER_CONFIG_LOCATION, user=getuser()))
 
 
 @logdec
@@ -74,12 +70,16 @@ def assure_path(path_arg: str | None) -> Path | None:
     return None
 
 
+@ft.lru_cache(maxsize=1)
 @logdec
 def find_panhan_yaml() -> Path:
     """Look for `panhan.yaml` in default locations and return path.
 
     Returns instance - see code for order of precedence.
 
+    The result is cached for the lifetime of the process; call
+    `find_panhan_yaml.cache_clear()` to force a fresh lookup.
+
     Raises:
         FileNotFoundError: `panhan.yaml` was not found.
 
@@ -109,35 +109,200 @@ def update_environment(panhan_config: BaseConfig) -> None:
         os.environ.setdefault("PYPANDOC_PANDOC", panhan_config.pandoc_path)
 
 
+# Abort the header scan if the frontmatter block exceeds this size.
+_FRONTMATTER_SCAN_LIMIT = 64 * 1024
+
+# Leading YAML frontmatter block closed by '---' or '...' on its own line.
+_FRONTMATTER_PATTERN = re.compile(
+    r"\A---\s*\n(.*?)^(?:---|\.\.\.)\s*$\n?", re.DOTALL | re.MULTILINE
+)
+
+
+def _split_frontmatter(text: str) -> tuple[dict[str, Any], str]:
+    """Split markdown `text` into its YAML metadata and body.
+
+    Args:
+        text: markdown document text.
+
+    Returns:
+        (metadata, body) tuple; metadata is empty if no header found.
+    """
+    import yaml
+
+    match = _FRONTMATTER_PATTERN.match(text)
+    if not match:
+        return {}, text
+    metadata = yaml.load(match.group(1), Loader=_get_yaml_loader())
+    if not isinstance(metadata, dict):
+        metadata = {}
+    return metadata, text[match.end() :]
+
+
+def _dump_frontmatter(metadata: dict[str, Any], body: str) -> str:
+    """Serialize `metadata` and `body` back into a markdown document.
+
+    Args:
+        metadata: YAML frontmatter mapping.
+        body: markdown document body.
+
+    Returns:
+        markdown document text with frontmatter header.
+    """
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    header = yaml.dump(
+        metadata, Dumper=dumper, default_flow_style=False, allow_unicode=True
+    )
+    return f"---\n{header}---\n\n{body.lstrip()}"
+
+
+def _read_frontmatter_metadata(source_path: Path) -> dict[str, Any] | None:
+    """Read just the YAML frontmatter block of the file at `source_path`.
+
+    Only the slice between the leading and closing `---` delimiters is
+    read and parsed, so large document bodies are never loaded.
+
+    Args:
+        source_path: path to markdown source file.
+
+    Returns:
+        metadata dict, or None if no well-formed frontmatter was found.
+    """
+    import yaml
+
+    with source_path.open(encoding="utf-8") as file_handle:
+        if file_handle.readline().strip() != "---":
+            return None
+        header_lines: list[str] = []
+        header_size = 0
+        for line in file_handle:
+            if line.strip() in ("---", "..."):
+                break
+            header_size += len(line)
+            if header_size > _FRONTMATTER_SCAN_LIMIT:
+                return None
+            header_lines.append(line)
+        else:
+            # Reached end of file without a closing delimiter.
+            return None
+    metadata = yaml.load("".join(header_lines), Loader=_get_yaml_loader())
+    return metadata if isinstance(metadata, dict) else {}
+
+
+@ft.lru_cache(maxsize=512)
+def _load_panhan_frontmatter_cached(path_str: str, mtime_ns: int) -> PanhanFrontmatter:
+    """Parse panhan frontmatter at `path_str`, memoized on file identity.
+
+    Args:
+        path_str: path to markdown source file.
+        mtime_ns: file modification time in nanoseconds.
+
+    Returns:
+        panhan frontmatter object.
+    """
+    source_path = Path(path_str)
+    metadata = _read_frontmatter_metadata(source_path)
+    if metadata is None:
+        metadata, _ = _split_frontmatter(source_path.read_text())
+    panhan_frontmatter: list[dict[str, Any]] = metadata.get("panhan", {})
+    return PanhanFrontmatter(panhan_frontmatter)
+
+
 @logdec
 def load_panhan_frontmatter(source_path: Path) -> PanhanFrontmatter:
     """Read markdown file at `source_path` and return panhan frontmatter.
 
+    The frontmatter header is scanned directly so the document body is
+    not read; a full-file parse is the fallback for anything the scan
+    does not recognise. Results are cached per (path, mtime) so a
+    source is parsed at most once per run.
+
     Args:
         source_path: path to markdown source file.
 
     Returns:
         panhan frontmatter object.
     """
-    panhan_frontmatter: list[dict[str, Any]] = frontmatter.load(
-        source_path
-    ).metadata.get("panhan", {})
-    return PanhanFrontmatter(panhan_frontmatter)
+    return _load_panhan_frontmatter_cached(str(source_path), source_path.stat().st_mtime_ns)
+
+
+@ft.lru_cache(maxsize=32)
+def _load_base_config_cached(path_str: str, mtime_ns: int) -> BaseConfig:
+    """Parse panhan config at `path_str`, memoized on file identity.
+
+    `mtime_ns` is part of the cache key so edits to the file invalidate
+    the cached entry automatically.
+
+    Args:
+        path_str: resolved path to panhan.yaml.
+        mtime_ns: file modification time in nanoseconds.
+
+    Returns:
+        panhan config object.
+    """
+    import yaml
+
+    with Path(path_str).open("rb") as file_handle:
+        panhan_dict = yaml.load(file_handle, Loader=_get_yaml_loader())
+    return BaseConfig(**panhan_dict)
 
 
 @logdec
 def load_base_config(panhan_path: Path) -> BaseConfig:
     """Read panhan config `panhan_path` and return config object.
 
+    The parsed config is cached per (path, mtime) so repeated loads of
+    an unchanged file skip the YAML parse.
+
     Args:
         panhan_path: path to panhan.yaml.
 
     Returns:
         panhan config object.
     """
-    yaml_str = panhan_path.read_text()
-    panhan_dict = yaml.safe_load(yaml_str)
-    return BaseConfig(**panhan_dict)
+    panhan_path = panhan_path.resolve()
+    return _load_base_config_cached(str(panhan_path), panhan_path.stat().st_mtime_ns)
+
+
+def _cache_key(document_text: str, pypandoc_kwargs: dict[str, Any]) -> str:
+    """Derive a cache key from document content and pandoc settings.
+
+    Args:
+        document_text: document text as it will be fed to pandoc.
+        pypandoc_kwargs: kwargs as produced by `get_pypandoc_kwargs`.
+
+    Returns:
+        hex digest identifying this (content, settings) pair.
+    """
+    import hashlib
+    import json
+
+    kwargs_repr = json.dumps(pypandoc_kwargs, sort_keys=True, default=str)
+    return hashlib.blake2b(document_text.encode() + kwargs_repr.encode()).hexdigest()
+
+
+# Resolved-config kwargs, keyed by config repr; many sources typically
+# resolve to the same few configs.
+_pypandoc_kwargs_cache: dict[str, dict[str, Any]] = {}
+
+
+def _get_pypandoc_kwargs_cached(document_config: DocumentConfig) -> dict[str, Any]:
+    """Get pypandoc kwargs for `document_config`, reusing prior results.
+
+    Args:
+        document_config: resolved document config.
+
+    Returns:
+        kwarg dict (shared between identical configs; treat as
+        read-only).
+    """
+    key = repr(document_config)
+    pypandoc_kwargs = _pypandoc_kwargs_cache.get(key)
+    if pypandoc_kwargs is None:
+        pypandoc_kwargs = document_config.get_pypandoc_kwargs()
+        _pypandoc_kwargs_cache[key] = pypandoc_kwargs
+    return pypandoc_kwargs
 
 
 @logdec
@@ -171,12 +336,35 @@ def resolve_config(
 
 
 @logdec
-def convert_file(source_path: Path | str, **pypandoc_kwargs: dict[str, Any]) -> str | None:
-    return pypandoc.convert_file(str(source_path), **pypandoc_kwargs)
+def convert_file(
+    source_path: Path | str | list[str], **pypandoc_kwargs: dict[str, Any]
+) -> str | None:
+    if (
+        _server_backend is not None
+        and not isinstance(source_path, list)
+        and _server_backend.supports(pypandoc_kwargs)
+    ):
+        return _server_backend.convert(Path(source_path).read_text(), pypandoc_kwargs)
+
+    import pypandoc  # type: ignore
+
+    if not isinstance(source_path, list):
+        source_path = str(source_path)
+    return pypandoc.convert_file(source_path, **pypandoc_kwargs)
 
 
 @logdec
-def process_source(source_path: Path, panhan_config: BaseConfig, preset_name: str | None, output_file: str | None) -> None:
+def convert_text(source_text: str, **pypandoc_kwargs: dict[str, Any]) -> str | None:
+    if _server_backend is not None and _server_backend.supports(pypandoc_kwargs):
+        return _server_backend.convert(source_text, pypandoc_kwargs)
+
+    import pypandoc  # type: ignore
+
+    return pypandoc.convert_text(source_text, format="markdown", **pypandoc_kwargs)
+
+
+@logdec
+def process_source(source_path: Path, panhan_config: BaseConfig, preset_name: str | None, output_file: str | None, cache: bool = False) -> None:
     """Read markdown source at `source_path`, resolve config, write output with pypandoc.
 
     Args:
@@ -184,33 +372,202 @@ def process_source(source_path: Path, panhan_config: BaseConfig, preset_name: st
         panhan_config: panhan config object.
         preset_name: name of preset to use.
         output_file: name of output file.
+        cache: reuse on-disk cached output for unchanged conversions.
     """
-    document = frontmatter.loads(source_path.read_text())
+    source_text = source_path.read_text()
+    metadata, body = _split_frontmatter(source_text)
 
     if preset_name:
-        document.metadata["panhan"] = [{"use_preset": preset_name, "output_file": output_file}]
+        metadata["panhan"] = [{"use_preset": preset_name, "output_file": output_file}]
 
-    panhan_frontmatter = PanhanFrontmatter(document.metadata.get("panhan", {}))
+    panhan_frontmatter = PanhanFrontmatter(metadata.get("panhan", {}))
 
     for document_config in panhan_frontmatter.document_config_list:
         document_config = resolve_config(
             document_config=document_config, panhan_config=panhan_config
         )
-        document.metadata = {**document_config.metadata, **document.metadata}
-        pypandoc_kwargs = document_config.get_pypandoc_kwargs()
-        output_dest = pypandoc_kwargs.get("outputfile") or "stdout"
-        logger.info("Writing to: %s", output_dest)
-        with tempfile.NamedTemporaryFile(suffix=source_path.suffix) as temp_file:
-            frontmatter.dump(document, temp_file)
-            output = convert_file(temp_file.name, **pypandoc_kwargs)
+        pypandoc_kwargs = _get_pypandoc_kwargs_cached(document_config)
+        outputfile = pypandoc_kwargs.get("outputfile")
+        logger.info("Writing to: %s", outputfile or "stdout")
+
+        if preset_name or document_config.metadata:
+            # Metadata was injected or merged - serialize the modified
+            # document and hand the text straight to pandoc.
+            metadata = {**document_config.metadata, **metadata}
+            document_text = _dump_frontmatter(metadata, body)
+        else:
+            # Document is unchanged from the source file - no need to
+            # reserialize it, pandoc can read the file directly.
+            document_text = None
+
+        if cache and outputfile:
+            cached_path = (
+                CACHE_DIR
+                / _cache_key(document_text or source_text, pypandoc_kwargs)
+                / Path(str(outputfile)).name
+            )
+            if cached_path.is_file():
+                logger.info("Reusing cached output for: %s", source_path)
+                shutil.copy2(cached_path, str(outputfile))
+                continue
+
+        if document_text is not None:
+            output = convert_text(document_text, **pypandoc_kwargs)
+        else:
+            output = convert_file(source_path, **pypandoc_kwargs)
+
+        if cache and outputfile and Path(str(outputfile)).is_file():
+            cached_path.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(str(outputfile), cached_path)
+
         if output:
             logger.info("<PANHAN OUTPUT START>")
             print(output)
             logger.info("<PANHAN OUTPUT END>")
 
 
+def _freeze_pypandoc_kwargs(pypandoc_kwargs: dict[str, Any]) -> tuple[Any, ...]:
+    """Build a hashable grouping key from a pypandoc kwargs dict.
+
+    Args:
+        pypandoc_kwargs: kwargs as produced by `get_pypandoc_kwargs`.
+
+    Returns:
+        hashable key tuple.
+    """
+    return tuple(
+        (key, tuple(value) if isinstance(value, list) else str(value))
+        for key, value in sorted(pypandoc_kwargs.items())
+    )
+
+
+# Sentinel separating documents sharing one pandoc invocation; only
+# used for output formats that pass raw HTML comments through.
+_SPLIT_SENTINEL = "<!--PANHAN-SPLIT-CD985272-->"
+_SENTINEL_FORMATS = frozenset({"html", "html4", "html5", "markdown", "gfm", "commonmark"})
+
+
+def _sentinel_eligible(jobs: list[tuple[Path, dict[str, Any]]]) -> bool:
+    """Check whether `jobs` can be converted via sentinel splitting.
+
+    Requires several jobs with identical settings apart from distinct
+    output files, a sentinel-safe output format, and no standalone
+    wrapping (which would apply the document template to the combined
+    text rather than to each part).
+
+    Args:
+        jobs: (source path, pypandoc kwargs) pairs sharing a signature.
+
+    Returns:
+        True if the jobs can share one sentinel-split invocation.
+    """
+    if len(jobs) < 2:
+        return False
+    output_files = [pypandoc_kwargs.get("outputfile") for _, pypandoc_kwargs in jobs]
+    if not all(output_files) or len({str(f) for f in output_files}) != len(jobs):
+        return False
+    pypandoc_kwargs = jobs[0][1]
+    if pypandoc_kwargs.get("to") not in _SENTINEL_FORMATS:
+        return False
+    extra_args = pypandoc_kwargs.get("extra_args") or []
+    return not ({"--standalone", "-s"} & set(extra_args))
+
+
+def _convert_batch_split(jobs: list[tuple[Path, dict[str, Any]]]) -> None:
+    """Convert several sources to distinct outputs in one pandoc call.
+
+    The sources are concatenated around a sentinel comment, converted in
+    a single invocation, and the output is split back apart and written
+    to each job's output file. Falls back to per-file conversion if the
+    sentinel does not survive.
+
+    Args:
+        jobs: (source path, pypandoc kwargs) pairs sharing a signature.
+    """
+    logger.info("Processing batch: %s", [str(path) for path, _ in jobs])
+    shared_kwargs = dict(jobs[0][1])
+    shared_kwargs.pop("outputfile", None)
+    combined = f"\n\n{_SPLIT_SENTINEL}\n\n".join(path.read_text() for path, _ in jobs)
+    converted = convert_text(combined, **shared_kwargs) or ""
+    parts = converted.split(_SPLIT_SENTINEL)
+    if len(parts) != len(jobs):
+        logger.info("Sentinel split failed; converting files individually.")
+        for source_path, pypandoc_kwargs in jobs:
+            logger.info("Writing to: %s", pypandoc_kwargs.get("outputfile"))
+            convert_file(source_path, **pypandoc_kwargs)
+        return
+    for (_, pypandoc_kwargs), part in zip(jobs, parts):
+        outputfile = pypandoc_kwargs["outputfile"]
+        logger.info("Writing to: %s", outputfile)
+        Path(str(outputfile)).write_text(part.strip() + "\n")
+
+
 @logdec
-def process_source_files(SOURCE: str | Iterable[str], preset: str | None, output: str | None, config: str | None) -> None:
+def process_source_batch(source_paths: Iterable[Path], panhan_config: BaseConfig) -> None:
+    """Convert sources in batches grouped by identical pandoc settings.
+
+    Sources resolving to the same pypandoc kwargs (ignoring the output
+    file) share a single pandoc invocation: distinct output files are
+    handled by sentinel splitting where the format allows, otherwise
+    pandoc concatenates the group into its one output. Sources that
+    need their metadata rewritten are processed individually.
+
+    Args:
+        source_paths: paths to markdown source files.
+        panhan_config: panhan config object.
+    """
+    jobs: list[tuple[Path, dict[str, Any]]] = []
+    singles: list[Path] = []
+    for source_path in source_paths:
+        document_configs = load_panhan_frontmatter(source_path).document_config_list
+        resolved_configs = [
+            resolve_config(document_config=document_config, panhan_config=panhan_config)
+            for document_config in document_configs
+        ]
+        if any(document_config.metadata for document_config in resolved_configs):
+            singles.append(source_path)
+            continue
+        for document_config in resolved_configs:
+            jobs.append((source_path, _get_pypandoc_kwargs_cached(document_config)))
+
+    # Bucket jobs by their settings signature, output file excluded.
+    buckets: dict[tuple[Any, ...], list[tuple[Path, dict[str, Any]]]] = {}
+    for source_path, pypandoc_kwargs in jobs:
+        signature = _freeze_pypandoc_kwargs(
+            {key: value for key, value in pypandoc_kwargs.items() if key != "outputfile"}
+        )
+        buckets.setdefault(signature, []).append((source_path, pypandoc_kwargs))
+
+    for bucket in buckets.values():
+        if _sentinel_eligible(bucket):
+            _convert_batch_split(bucket)
+            continue
+        groups: dict[tuple[Any, ...], tuple[dict[str, Any], list[Path]]] = {}
+        for source_path, pypandoc_kwargs in bucket:
+            key = _freeze_pypandoc_kwargs(pypandoc_kwargs)
+            groups.setdefault(key, (pypandoc_kwargs, []))[1].append(source_path)
+        for pypandoc_kwargs, group_paths in groups.values():
+            logger.info("Processing batch: %s", [str(path) for path in group_paths])
+            output_dest = pypandoc_kwargs.get("outputfile") or "stdout"
+            logger.info("Writing to: %s", output_dest)
+            output = convert_file([str(path) for path in group_paths], **pypandoc_kwargs)
+            if output:
+                logger.info("<PANHAN OUTPUT START>")
+                print(output)
+                logger.info("<PANHAN OUTPUT END>")
+
+    for source_path in singles:
+        logger.info("Processing source: %s", source_path)
+        process_source(
+            source_path=source_path,
+            panhan_config=panhan_config,
+            preset_name=None,
+            output_file=None,
+        )
+
+
+@logdec
+def process_source_files(SOURCE: str | Iterable[str], preset: str | None, output: str | None, config: str | None, batch: bool = False, jobs: int = 1, cache: bool = False) -> None:
     """Read and interpret source file(s) with panhan config, output with pypandoc.
 
     Args:
@@ -221,6 +578,9 @@ def process_source_files(SOURCE: str | Iterable[str], preset: str | None, output
     if isinstance(SOURCE, str):
         SOURCE = (SOURCE,)
 
+    # The output cache can also be enabled via the environment.
+    cache = cache or os.environ.get("PANHAN_CACHE") == "1"
+
     # Load Panhan YAML.
     base_config_path = assure_path(config) or find_panhan_yaml()
     logger.info("Loading base config: %s", base_config_path)
@@ -229,9 +589,37 @@ def process_source_files(SOURCE: str | Iterable[str], preset: str | None, output
     # Update environment according to config.
     update_environment(panhan_config)
 
-    # Process each source file.
-    source_path_gen = (Path(src) for src in SOURCE)
-    for source_path in source_path_gen:
-        logger.info("Processing source: %s", source_path)
-        process_source(source_path=source_path, panhan_config=panhan_config, preset_name=preset, output_file=output)
-    logger.info("Process completed.")
+    # Optionally keep one pandoc server alive for the whole run.
+    global _server_backend
+    if _server_backend is None and os.environ.get("PANHAN_PANDOC_SERVER") == "1":
+        from panhan.backend import PandocServerBackend
+
+        pandoc_path = panhan_config.pandoc_path or os.environ.get("PYPANDOC_PANDOC", "pandoc")
+        _server_backend = PandocServerBackend.try_start(pandoc_path)
+
+    try:
+        # Process each source file.
+        source_paths = [Path(src) for src in SOURCE]
+        if batch and not preset:
+            process_source_batch(source_paths=source_paths, panhan_config=panhan_config)
+            logger.info("Process completed.")
+            return
+        if batch:
+            logger.info("Batch mode is incompatible with --preset; processing per file.")
+        if jobs > 1:
+            # Threads suffice: the work happens in pandoc subprocesses and
+            # the GIL is released while waiting on them.
+            process_func = ft.partial(
+                process_source, panhan_config=panhan_config, preset_name=preset, output_file=output, cache=cache
+            )
+            with concurrent.futures.ThreadPoolExecutor(max_workers=jobs) as executor:
+                list(executor.map(process_func, source_paths))
+        else:
+            for source_path in source_paths:
+                logger.info("Processing source: %s", source_path)
+                process_source(source_path=source_path, panhan_config=panhan_config, preset_name=preset, output_file=output, cache=cache)
+        logger.info("Process completed.")
+    finally:
+        if _server_backend is not None:
+            _server_backend.stop()
+            _server_backend = None
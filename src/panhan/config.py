@@ -1,12 +1,10 @@
 import dataclasses as dc
-import inspect
+import functools as ft
 from pathlib import Path
 from typing import Any
 
-from panhan.logger import logdec
 
-
-@dc.dataclass
+@dc.dataclass(slots=True)
 class DocumentConfig:
     """Document format configuration data."""
 
@@ -17,36 +15,58 @@ class DocumentConfig:
     pandoc_args: dict[str, Any] = dc.field(default_factory=dict)
     filters: dict[str, bool] = dc.field(default_factory=dict)
 
-    @logdec
+    def is_empty(self) -> bool:
+        """Check whether no config values are set.
+
+        Returns:
+            True if every field is unset or empty.
+        """
+        return not (
+            self.use_preset
+            or self.output_format
+            or self.output_file
+            or self.metadata
+            or self.pandoc_args
+            or self.filters
+        )
+
     def combine(self, other: "DocumentConfig") -> "DocumentConfig":
         """Combine config values of `self` with `other`.
 
         If config keys are present in both objects, `self` will take precedence.
 
+        Combining with an empty config is a no-op and returns the other
+        operand directly rather than allocating a copy.
+
         Args:
             other: another document config object.
 
         Returns:
             combined document config.
         """
-        use_preset = self.use_preset or other.use_preset
-        output_format = self.output_format or other.output_format
-        output_file = self.output_file or other.output_file
-        metadata = {**other.metadata, **self.metadata}
-        pandoc_args = {**other.pandoc_args, **self.pandoc_args}
-        filters = {**other.filters, **self.filters}
-
-        return DocumentConfig(
-            use_preset=use_preset,
-            output_format=output_format,
-            output_file=output_file,
-            metadata=metadata,
-            pandoc_args=pandoc_args,
-            filters=filters,
-        )
+        if other.is_empty():
+            return self
+        if self.is_empty():
+            return other
+
+        # Bypass the generated __init__: every field is assigned below,
+        # so its default factories would be wasted allocations.
+        combined: DocumentConfig = object.__new__(DocumentConfig)
+        combined.use_preset = self.use_preset or other.use_preset
+        combined.output_format = self.output_format or other.output_format
+        combined.output_file = self.output_file or other.output_file
+        metadata = dict(other.metadata)
+        metadata.update(self.metadata)
+        combined.metadata = metadata
+        pandoc_args = dict(other.pandoc_args)
+        pandoc_args.update(self.pandoc_args)
+        combined.pandoc_args = pandoc_args
+        filters = dict(other.filters)
+        filters.update(self.filters)
+        combined.filters = filters
+        return combined
 
     @classmethod
-    @logdec
     def from_dict(cls, dict_: dict[str, Any]) -> "DocumentConfig":
         """Create config from dictionary.
 
@@ -56,21 +76,20 @@ class DocumentConfig:
         Returns:
             document config.
         """
-        valid_keys = [
-            key
-            for key in inspect.signature(cls.__init__).parameters.keys()
-            if key != "self"
-        ]
+        valid_keys = _DOCUMENT_CONFIG_KEYS
         invalid_keys = sorted(set(dict_.keys()).difference(valid_keys))
         if invalid_keys:
-            msg = f"Unexpected key(s) in config: {invalid_keys}. Valid keys are: {valid_keys}."
+            msg = f"Unexpected key(s) in config: {invalid_keys}. Valid keys are: {sorted(valid_keys)}."
             raise KeyError(msg)
         return DocumentConfig(**dict_)
 
-    @logdec
     def get_pypandoc_kwargs(self) -> dict[str, Any]:
         """Get dictionary of kwargs for pypandoc.
 
+        Format verification is disabled: it costs two extra pandoc
+        launches (--list-input-formats / --list-output-formats) per
+        conversion and pandoc rejects unknown formats itself anyway.
+
         Returns:
             kwarg dict.
         """
@@ -87,12 +106,17 @@ class DocumentConfig:
             "outputfile": self.output_file,
             "extra_args": extra_args,
             "filters": filters,
+            "verify_format": False,
         }
 
         return pypandoc_kwargs
 
 
-@dc.dataclass(init=False)
+# Computed once at import; avoids an inspect.signature call per from_dict.
+_DOCUMENT_CONFIG_KEYS = frozenset(field.name for field in dc.fields(DocumentConfig))
+
+
+@dc.dataclass(slots=True, init=False)
 class PanhanFrontmatter:
     """Config from source file frontmatter."""
 
@@ -104,14 +128,16 @@ class PanhanFrontmatter:
         ]
 
 
-@dc.dataclass
+@dc.dataclass(slots=True)
 class BaseConfig:
     """Base config data."""
 
     presets: dict[str, Any]
     pandoc_path: str | None
+    _preset_cache: dict[str, DocumentConfig] = dc.field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
-    @logdec
     def get_preset(
         self, preset_name: str, default: None | DocumentConfig = None
     ) -> DocumentConfig:
@@ -119,6 +145,9 @@ class BaseConfig:
 
         If `preset_name` is not found and default is not provided, the application will error and close.
 
+        Resolved presets are cached on the instance, so each preset
+        chain is walked at most once per config lifetime.
+
         Args:
             preset_name: name of preset stored in panhan.yaml.
             default: returned if `preset_name` not found. Defaults to None.
@@ -126,11 +155,15 @@ class BaseConfig:
         Returns:
             document settings for `preset_name` or `default` if not found.
         """
+        cached = self._preset_cache.get(preset_name)
+        if cached is not None:
+            return cached
         if preset_name in self.presets:
             doc_config = DocumentConfig.from_dict(self.presets[preset_name])
             if doc_config.use_preset:
                 parent = self.get_preset(doc_config.use_preset)
                 doc_config = doc_config.combine(parent)
+            self._preset_cache[preset_name] = doc_config
             return doc_config
         if default:
             return default
@@ -141,7 +174,6 @@ class BaseConfig:
         )
         raise KeyError(msg)
 
-    @logdec
     def get_default_preset(self) -> DocumentConfig:
         """Get default preset config if defined.
 
@@ -155,14 +187,16 @@ class BaseConfig:
 
 DocumentConfigDict = dict[str, DocumentConfig]
 
-ARG_DELIMITER = "<delimiter>"
-
 
+@ft.lru_cache(maxsize=256)
 def format_flag(flag: str) -> str:
     """Prepend correct number of dashes to CLI option `flag`.
 
     Single letter flags have one '-', all others have '--'.
 
+    Flag names repeat across presets and documents, so results are
+    cached.
+
     Args:
         flag: command line flag.
 
@@ -173,22 +207,37 @@ def format_flag(flag: str) -> str:
     return f"--{flag}" if len(flag) > 1 else f"-{flag}"
 
 
+@ft.lru_cache(maxsize=256)
+def _format_str_value(value: str) -> str:
+    """Strip `value` and quote it if it contains spaces.
+
+    Args:
+        value: string command line value.
+
+    Returns:
+        modified value.
+    """
+    value = value.strip()
+    return f'"{value}"' if " " in value else value
+
+
 def format_value(value: Any) -> Any:
     """Add quotes around value if it contains spaces.
 
+    String values repeat across presets and are cached; other types
+    need no formatting and are returned as-is.
+
     Args:
         value: command line value.
 
     Returns:
         modified value.
     """
-    if isinstance(value, str):
-        value = value.strip()
-        return f'"{value}"' if " " in value else value
+    if type(value) is str:
+        return _format_str_value(value)
     return value
 
 
-@logdec
 def pandoc_args_dict_to_list(pandoc_args_dict: dict[str, Any]) -> list[str]:
     """Transform dict of CLI args to list for pypandoc.
 
@@ -204,21 +253,18 @@ def pandoc_args_dict_to_list(pandoc_args_dict: dict[str, Any]) -> list[str]:
     Returns:
         CLI args as list of strings.
     """
-    pandoc_args_filtered = {
-        key: value for key, value in pandoc_args_dict.items() if value is not False
-    }
-    delimiter = ARG_DELIMITER
-    pandoc_args_list = delimiter.join(
-        f"{format_flag(flag)}{delimiter}{format_value(value)}"
-        if not isinstance(value, bool)
-        else f"{format_flag(flag)}"
-        for flag, value in pandoc_args_filtered.items()
-        if value is not False
-    ).split(delimiter)
+    pandoc_args_list: list[str] = []
+    for flag, value in pandoc_args_dict.items():
+        if value is False:
+            continue
+        formatted_flag = format_flag(flag)
+        if value is True:
+            pandoc_args_list.append(formatted_flag)
+        else:
+            pandoc_args_list.extend((formatted_flag, str(format_value(value))))
     return pandoc_args_list
 
 
-@logdec
 def pandoc_filter_dict_to_list(pandoc_filters_dict: dict[str, bool]) -> list[str]:
     """Transform dict of filters to list for pypandoc.
 
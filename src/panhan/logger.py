@@ -1,12 +1,17 @@
 import functools as ft
 import inspect
-import sys
-from logging import ERROR, Formatter, Logger, StreamHandler
+import os
+from logging import DEBUG, ERROR, Formatter, Logger, StreamHandler
 from typing import Callable, ParamSpec, TypeVar
 
 T = TypeVar("T")
 P = ParamSpec("P")
 
+# Call tracing is opt-in via PANHAN_LOG=debug; without it (or under
+# python -O) logdec returns functions undecorated, so hot paths carry
+# no wrapper at all.
+_TRACE_CALLS = __debug__ and os.environ.get("PANHAN_LOG", "").lower() == "debug"
+
 
 def get_logger() -> Logger:
     """Get application logger.
@@ -32,29 +37,34 @@ logger = get_logger()
 def logdec(func: Callable[P, T]) -> Callable[P, T]:
     """Decorator for logging function calls and arguments.
 
+    A no-op unless PANHAN_LOG=debug is set in the environment, in which
+    case calls are traced at DEBUG level. The call signature is only
+    stringified when the logger is enabled for DEBUG.
+
     Args:
         func: any function that should be logged.
 
-    Raises:
-        e: exception raised by `func`.
-
     Returns:
-        decorated function.
+        decorated function (or `func` unchanged when tracing is off).
     """
+    if not _TRACE_CALLS:
+        return func
+
+    module_name = getattr(inspect.getmodule(func), "__name__", "")
+    func_name = f"{module_name}.{func.__name__}"
 
     @ft.wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
-        module_name = getattr(inspect.getmodule(func), "__name__", "")
-        func_name = f"{module_name}.{func.__name__}"
-        args_repr = [str(a) for a in args]
-        kwargs_repr = [f"{k}={v}" for k, v in kwargs.items()]
-        args_and_kwargs = args_repr + kwargs_repr
-        signature = ", ".join(args_and_kwargs) if args_and_kwargs else "<no args>"
-        logger.debug("Called: '%s' with: '%s'", func_name, signature)
+        if logger.isEnabledFor(DEBUG):
+            args_repr = [str(a) for a in args]
+            kwargs_repr = [f"{k}={v}" for k, v in kwargs.items()]
+            args_and_kwargs = args_repr + kwargs_repr
+            signature = ", ".join(args_and_kwargs) if args_and_kwargs else "<no args>"
+            logger.debug("Called: '%s' with: '%s'", func_name, signature)
         try:
             return func(*args, **kwargs)
         except Exception as e:
             logger.exception("Exception raised in %s. exception: %s", func_name, e)
-            sys.exit(1)
+            raise
 
     return wrapper